@@ -4,7 +4,9 @@
 import os
 
 def eval_sum(simulation):
-	with open(os.path.join(simulation['folder'], simulation.settings['output'][0]['y-file']), 'r') as f:
-		values_sum = sum(map(float, f.readlines()[:-1]))
+	with open(os.path.join(simulation['folder'], simulation.getSetting({'set': 'output', 'name': 'y-file'}).value), 'rb') as f:
+		values = f.read().split()
+
+	values_sum = sum(map(float, values[:-1]))
 
 	return values_sum
@@ -4,10 +4,10 @@
 import os
 
 def eval_sum(simulation):
-	with open(os.path.join(simulation['folder'], simulation.settings['output'][0]['file']), 'r') as f:
-		numbers_sum = sum(map(int, f.readlines()))
+	with open(os.path.join(simulation['folder'], simulation.getSetting({'set': 'output', 'name': 'file'}).value), 'rb') as f:
+		numbers_sum = sum(map(int, f.read().split()))
 
 	return numbers_sum
 
 def eval_multipleSums(simulations):
-	return sum([eval_sum(s) for s in simulations])
+	return sum(eval_sum(s) for s in simulations)
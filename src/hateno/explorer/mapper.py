@@ -28,6 +28,19 @@ class Mapper():
 		`True` to not add the simulations to the manager.
 	'''
 
+	# Names of the events triggered
+	EVENTS = [
+		'read-start', 'read-end',
+		'map-start', 'map-end',
+		'node-start', 'node-progress', 'node-end',
+		'generate-start', 'generate-end',
+		'evaluation-start', 'evaluation-end',
+		'explorer-find-start', 'explorer-find-end',
+		'explorer-searches-start', 'explorer-searches-end',
+		'explorer-search-start', 'explorer-search-end',
+		'explorer-search-iteration-start', 'explorer-search-iteration-end'
+	]
+
 	def __init__(self, simulations_folder, config_name = None, *, generate_only = True):
 		self._simulations_folder = simulations_folder if type(simulations_folder) is Folder else Folder(simulations_folder)
 		self._config_name = config_name
@@ -43,17 +56,7 @@ class Mapper():
 
 		self._index_regex_compiled = None
 
-		self.events = Events([
-			'read-start', 'read-end',
-			'map-start', 'map-end',
-			'node-start', 'node-progress', 'node-end',
-			'generate-start', 'generate-end',
-			'evaluation-start', 'evaluation-end',
-			'explorer-find-start', 'explorer-find-end',
-			'explorer-searches-start', 'explorer-searches-end',
-			'explorer-search-start', 'explorer-search-end',
-			'explorer-search-iteration-start', 'explorer-search-iteration-end'
-		])
+		self.events = Events(self.EVENTS)
 
 	def __enter__(self):
 		'''
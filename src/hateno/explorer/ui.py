@@ -127,6 +127,10 @@ class MapperUI(MakerUI):
 			Description of the node.
 		'''
 
+		# The parent nodes will not progress while this one is mapped, their last values must be displayed
+		for bar in self._nodes_bars.values():
+			bar.flush()
+
 		if node is not None:
 			self._nodes_lines[depth] = self.addTextLine(f'Depth {depth}…', position = 2*depth + 1)
 			self._nodes_bars[depth] = self.addProgressBar(len(node['values']), position = 2*depth + 2)
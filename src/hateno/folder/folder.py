@@ -52,6 +52,7 @@ class Folder():
 			os.makedirs(self._tmp_dir)
 
 		self._settings = None
+		self._settings_sets_dict = None
 
 		self._config_folders_dict = None
 		self._configs = {}
@@ -396,6 +397,35 @@ class Folder():
 
 		return self._settings
 
+	@property
+	def settings_sets(self):
+		'''
+		Return the descriptions of the settings sets, indexed by their names.
+
+		Returns
+		-------
+		settings_sets : dict
+			Each set name is associated to a tuple containing the description of the set, and the descriptions of its settings, indexed by their names.
+		'''
+
+		if self._settings_sets_dict is None:
+			self._settings_sets_dict = {}
+
+			# Only the first definition of a set is used, as well as the first definition of a setting in this set
+
+			for settings_set in self.settings['settings']:
+				if settings_set['set'] in self._settings_sets_dict:
+					continue
+
+				settings_dicts = {}
+
+				for setting in settings_set['settings']:
+					settings_dicts.setdefault(setting['name'], setting)
+
+				self._settings_sets_dict[settings_set['set']] = (settings_set, settings_dicts)
+
+		return self._settings_sets_dict
+
 	@property
 	def program_files(self):
 		'''
@@ -570,7 +600,8 @@ class Folder():
 			The same value, fixed.
 		'''
 
-		value = copy.deepcopy(value)
+		if type(value) in [list, dict]:
+			value = copy.deepcopy(value)
 
 		for fixer in before + self.settings['fixers'] + after:
 			value = self.fixers.call(fixer, value)
@@ -31,6 +31,9 @@ class Generator():
 
 		self._variables = None
 
+		# Contents of the skeletons, read once as they are reused at each generation
+		self._skeletons_contents = {}
+
 	@property
 	def folder(self):
 		'''
@@ -229,6 +232,27 @@ class Generator():
 			for k in range(loop_from, loop_to + 1)
 		])
 
+	def _getSkeletonContent(self, skeleton_filename):
+		'''
+		Get the content of a skeleton, read only the first time.
+
+		Parameters
+		----------
+		skeleton_filename : str
+			Path to the skeleton.
+
+		Returns
+		-------
+		skeleton : str
+			Content of the skeleton.
+		'''
+
+		if skeleton_filename not in self._skeletons_contents:
+			with open(skeleton_filename, 'r') as f:
+				self._skeletons_contents[skeleton_filename] = f.read()
+
+		return self._skeletons_contents[skeleton_filename]
+
 	def _generateScript(self, skeleton_filename, script_filename):
 		'''
 		Generate a script from a skeleton.
@@ -242,16 +266,17 @@ class Generator():
 			Path to the script to write.
 		'''
 
-		with open(skeleton_filename, 'r') as f:
-			skeleton = f.read()
-
-		script_content = self._forloop_regex.sub(self._replaceForLoop, skeleton)
+		script_content = self._forloop_regex.sub(self._replaceForLoop, self._getSkeletonContent(skeleton_filename))
 		script_content = self._replaceVariables(script_content)
 
 		with open(script_filename, 'w') as f:
 			f.write(script_content)
 
-		os.chmod(script_filename, os.stat(script_filename).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+		script_mode = os.stat(script_filename).st_mode
+		exec_mode = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+		if (script_mode & exec_mode) != exec_mode:
+			os.chmod(script_filename, script_mode | exec_mode)
 
 	def generate(self, dest_folder, config_name = None, *, empty_dest = False, basedir = None):
 		'''
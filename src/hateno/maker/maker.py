@@ -35,6 +35,20 @@ class Maker():
 		Options to override.
 	'''
 
+	# Names of the events triggered
+	EVENTS = [
+		'close-start', 'close-end',
+		'remote-open-start', 'remote-open-end',
+		'delete-scripts',
+		'paused', 'resume',
+		'run-start', 'run-end',
+		'extract-start', 'extract-end', 'extract-progress',
+		'generate-start', 'generate-end',
+		'wait-start', 'wait-progress', 'wait-end',
+		'download-start', 'download-progress', 'download-end',
+		'addition-start', 'addition-progress', 'addition-end'
+	]
+
 	def __init__(self, simulations_folder, config_name = None, *, override_options = {}):
 		self._simulations_folder = simulations_folder if type(simulations_folder) is Folder else Folder(simulations_folder)
 		self._config_name = config_name
@@ -49,6 +63,8 @@ class Maker():
 		self._unknown_simulations = []
 		self._job_directory = None
 		self._job_log_file = None
+		self._job_state_raw = None
+		self._job_state = None
 
 		self._remote_scripts_dir = None
 
@@ -58,18 +74,7 @@ class Maker():
 		self._paused = False
 		self._state_attrs = ['simulations_to_extract', 'corruptions_counter', 'failures_counter', 'unknown_simulations', 'remote_scripts_dir']
 
-		self.events = Events([
-			'close-start', 'close-end',
-			'remote-open-start', 'remote-open-end',
-			'delete-scripts',
-			'paused', 'resume',
-			'run-start', 'run-end',
-			'extract-start', 'extract-end', 'extract-progress',
-			'generate-start', 'generate-end',
-			'wait-start', 'wait-progress', 'wait-end',
-			'download-start', 'download-progress', 'download-end',
-			'addition-start', 'addition-progress', 'addition-end'
-		])
+		self.events = Events(self.EVENTS)
 
 	def __enter__(self):
 		'''
@@ -189,7 +194,11 @@ class Maker():
 			'settings_file': 'settings.json',
 			'max_corrupted': -1,
 			'max_failures': 0,
-			'generate_only': False
+			'generate_only': False,
+			'wait_min_delay': 0.5,
+			'wait_max_delay': 30,
+			'wait_delay_factor': 1.5,
+			'download_workers': 4
 		}
 
 		try:
@@ -456,25 +465,38 @@ class Maker():
 
 		n_finished = 0
 
+		# The delay between two checks of the job state is increased each time nothing changes, and reset at each change
+		# The state is summed up by a few counts, enough to detect a change
+		delay = self._options['wait_min_delay']
+		previous_fingerprint = (0, 0, 0)
+
 		while True:
 			self._remote_folder.callHateno('job-state', [self._job_directory, self._job_log_file])
 
 			job_state = self._getJobState()
+			fingerprint = (len(job_state['log']), job_state['clients']['dead'], job_state['clients']['total'])
 
-			if len(job_state['log']) != n_finished:
-				n_finished = len(job_state['log'])
-				self.events.trigger('wait-progress', n_finished)
+			if fingerprint != previous_fingerprint:
+				previous_fingerprint = fingerprint
+				delay = self._options['wait_min_delay']
 
-				if n_finished == n_total:
-					break
+				if fingerprint[0] != n_finished:
+					n_finished = fingerprint[0]
+					self.events.trigger('wait-progress', n_finished)
+
+					if n_finished == n_total:
+						break
 
 			if job_state['clients']['total'] and job_state['clients']['dead'] == job_state['clients']['total']:
 				break
 
-			time.sleep(0.5)
+			time.sleep(delay)
+			delay = min(self._options['wait_delay_factor'] * delay, self._options['wait_max_delay'])
 
 		self._job_directory = None
 		self._job_log_file = None
+		self._job_state_raw = None
+		self._job_state = None
 
 		self.events.trigger('wait-end')
 
@@ -496,11 +518,22 @@ class Maker():
 		'''
 
 		try:
-			return json.loads(self._remote_folder.getFileContents(self._job_log_file))
+			job_state_raw = self._remote_folder.getFileContents(self._job_log_file)
 
 		except FileNotFoundError:
 			return {'clients': {'total': 0, 'dead': 0}, 'log': []}
 
+		# Most of the time the state did not change since the last check, no need to decode it again
+
+		if job_state_raw == self._job_state_raw:
+			return self._job_state
+
+		try:
+			self._job_state = json.loads(job_state_raw)
+			self._job_state_raw = job_state_raw
+
+			return self._job_state
+
 		except json.decoder.JSONDecodeError:
 			if retry > 0:
 				time.sleep(0.1)
@@ -509,6 +542,59 @@ class Maker():
 			else:
 				raise
 
+	def _receiveSimulations(self):
+		'''
+		Receive the generated simulations.
+		First try to receive all of them at once, as an archive. If it fails, receive them separately.
+		A simulation which does not exist on the remote is not an error here: its integrity check will fail.
+
+		Returns
+		-------
+		received : generator
+			Generator yielding, for each simulation, a tuple containing the generated simulation, its final destination and the local folder where it has been received.
+		'''
+
+		archive_dir = self._simulations_folder.tempdir()
+		archive_received = True
+
+		try:
+			self._remote_folder.receiveArchive(self._simulations_remote_basedir, archive_dir, delete = True)
+
+		except RemotePathNotFoundError:
+			pass
+
+		except RemoteArchiveError:
+			shutil.rmtree(archive_dir)
+			archive_received = False
+
+		if archive_received:
+			for simulation, simulation_dest in zip(self._simulations_to_generate, self._unknown_simulations):
+				local_folder = os.path.join(archive_dir, os.path.relpath(simulation['folder'], self._simulations_remote_basedir))
+
+				if not(os.path.isdir(local_folder)):
+					os.makedirs(local_folder)
+
+				yield simulation, simulation_dest, local_folder
+
+			shutil.rmtree(archive_dir)
+			return
+
+		# All simulations are received in the same temporary directory, which is deleted at the end with what remains inside
+
+		download_dir = self._simulations_folder.tempdir()
+		simulations_by_entry = {}
+
+		for k, (simulation, simulation_dest) in enumerate(zip(self._simulations_to_generate, self._unknown_simulations)):
+			local_folder = os.path.join(download_dir, str(k))
+			os.mkdir(local_folder)
+
+			simulations_by_entry[(simulation['folder'], local_folder)] = (simulation, simulation_dest)
+
+		for entry, _ in self._remote_folder.receiveMultiple(list(simulations_by_entry), delete = True, max_workers = self._options['download_workers']):
+			yield (*simulations_by_entry[entry], entry[1])
+
+		shutil.rmtree(download_dir)
+
 	def downloadSimulations(self):
 		'''
 		Download the generated simulations and add them to the manager.
@@ -523,15 +609,8 @@ class Maker():
 
 		success = True
 
-		for simulation, simulation_dest in zip(self._simulations_to_generate, self._unknown_simulations):
-			tmpdir = self._simulations_folder.tempdir()
-			try:
-				self._remote_folder.receive(simulation['folder'], tmpdir, delete = True)
-
-			except RemotePathNotFoundError:
-				pass
-
-			simulation['folder'] = tmpdir
+		for simulation, simulation_dest, local_folder in self._receiveSimulations():
+			simulation['folder'] = local_folder
 
 			if self._options['generate_only']:
 				if self._simulations_folder.checkIntegrity(simulation):
@@ -109,7 +109,10 @@ class MakerUI(UI):
 		'''
 
 		# Erase the "^C" due to the keyboard interruption
-		print('\r  ', end = '\r')
+		self._write('\r  \r')
+
+		if self._main_progress_bar is not None:
+			self._main_progress_bar.flush()
 
 		self._updateState('Paused')
 
@@ -210,7 +213,9 @@ class MakerUI(UI):
 			Number of executed simulations.
 		'''
 
+		# The job progresses slowly, the new value should not wait for the next update to be displayed
 		self._main_progress_bar.counter = n_executed
+		self._main_progress_bar.flush()
 
 	def _waitEnd(self):
 		'''
@@ -20,3 +20,16 @@ class RemotePathNotFoundError(RemoteFolderError):
 
 	def __init__(self, remote_path):
 		self.remote_path = remote_path
+
+class RemoteArchiveError(RemoteFolderError):
+	'''
+	Exception raised when a remote path cannot be received as an archive.
+
+	Parameters
+	----------
+	remote_path : str
+		The path.
+	'''
+
+	def __init__(self, remote_path):
+		self.remote_path = remote_path
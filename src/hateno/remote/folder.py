@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import collections
+import concurrent.futures
 import io
 import os
 import paramiko
+import pathlib
+import queue
+import shlex
 import shutil
 import subprocess
+import tarfile
 import time
 
 from .localsftp import LocalSFTP
 from .sftp import SFTP
 from .errors import *
 
+# The `data` extraction filter rejects unsafe members, use it when it is available (and required from Python 3.14)
+TAR_EXTRACT_KWARGS = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
 class RemoteFolder():
 	'''
 	Send files to and receive from a remote folder.
@@ -31,6 +40,9 @@ class RemoteFolder():
 		self._configuration = folder_conf
 		self._local = (self._configuration['host'] == 'local')
 
+		# Additional SFTP sessions, opened on the same SSH connection, and kept to be reused
+		self._sftp_pool = collections.deque()
+
 	def __enter__(self):
 		'''
 		Context manager to call `open()` and `close()` automatically.
@@ -81,26 +93,82 @@ class RemoteFolder():
 
 		return ssh
 
-	def open(self):
+	def _openSFTP(self):
 		'''
-		Open the connection.
+		Open a new SFTP session, using the SSH connection if we are not in local mode.
+
+		Returns
+		-------
+		sftp : SFTP|LocalSFTP
+			The SFTP session, in the working directory.
 		'''
 
 		if self._local:
-			self._sftp = LocalSFTP()
+			sftp = LocalSFTP()
 
 		else:
-			self._ssh = self._connectSSH(self._configuration)
-			self._sftp = SFTP.from_transport(self._ssh.get_transport())
+			sftp = SFTP.from_transport(self._ssh.get_transport())
 
 		if 'working_directory' in self._configuration:
-			self._sftp.chdir(self._configuration['working_directory'])
+			sftp.chdir(self._configuration['working_directory'])
+
+		return sftp
+
+	def _acquireSFTP(self):
+		'''
+		Get an additional SFTP session, from the pool if possible.
+		A pooled session is checked before being reused, and replaced by a new one if it does not respond anymore.
+
+		Returns
+		-------
+		sftp : SFTP|LocalSFTP
+			The SFTP session, in the working directory.
+		'''
+
+		while self._sftp_pool:
+			sftp = self._sftp_pool.popleft()
+
+			try:
+				sftp.normalize('.')
+
+			except (OSError, EOFError, paramiko.SSHException):
+				sftp.close()
+
+			else:
+				return sftp
+
+		return self._openSFTP()
+
+	def _releaseSFTP(self, sftp):
+		'''
+		Put an additional SFTP session back in the pool.
+
+		Parameters
+		----------
+		sftp : SFTP|LocalSFTP
+			The SFTP session to release.
+		'''
+
+		self._sftp_pool.append(sftp)
+
+	def open(self):
+		'''
+		Open the connection.
+		'''
+
+		if not(self._local):
+			self._ssh = self._connectSSH(self._configuration)
+
+		self._sftp = self._openSFTP()
 
 	def close(self):
 		'''
 		Close the connection.
 		'''
 
+		while self._sftp_pool:
+			self._sftp_pool.pop().close()
+
 		try:
 			self._ssh.close()
 
@@ -270,8 +338,39 @@ class RemoteFolder():
 			Local path of the received file/folder.
 		'''
 
+		return self._receiveWith(self._sftp, remote_path, local_path, delete = delete)
+
+	def _receiveWith(self, sftp, remote_path, local_path = None, *, delete = False):
+		'''
+		Receive a file or a folder using a given SFTP session.
+
+		Parameters
+		----------
+		sftp : SFTP|LocalSFTP
+			The SFTP session to use.
+
+		remote_path : str
+			Path of the remote file/folder to receive.
+
+		local_path : str
+			Name of the file/folder to create.
+
+		delete : boolean
+			`True` to delete the remote file/folder.
+
+		Raises
+		------
+		RemotePathNotFoundError
+			The remote file/folder does not exist.
+
+		Returns
+		-------
+		local_path : str
+			Local path of the received file/folder.
+		'''
+
 		try:
-			stats = self._sftp.stat(remote_path)
+			stats = sftp.stat(remote_path)
 
 		except FileNotFoundError:
 			raise RemotePathNotFoundError(remote_path)
@@ -279,10 +378,151 @@ class RemoteFolder():
 		if not(local_path):
 			local_path = os.path.basename(os.path.normpath(remote_path))
 
-		self._sftp.get(remote_path, local_path, delete)
+		sftp.get(remote_path, local_path, delete)
+
+		return local_path
+
+	def receiveArchive(self, remote_path, local_path, *, delete = False):
+		'''
+		Receive (download) a folder in one stream, by archiving it remotely with `tar`.
+		This avoids the requests needed for each file and folder by the SFTP protocol.
+		In local mode, the folder is simply received as usual.
+
+		Parameters
+		----------
+		remote_path : str
+			Path of the remote folder to receive.
+
+		local_path : str
+			Name of the folder to create.
+
+		delete : boolean
+			`True` to delete the remote folder.
+
+		Raises
+		------
+		RemotePathNotFoundError
+			The remote folder does not exist.
+
+		RemoteArchiveError
+			The archive cannot be created or read (e.g. `tar` is not available on the remote).
+
+		Returns
+		-------
+		local_path : str
+			Local path of the received folder.
+		'''
+
+		if self._local:
+			return self.receive(remote_path, local_path, delete = delete)
+
+		try:
+			self._sftp.stat(remote_path)
+
+		except FileNotFoundError:
+			raise RemotePathNotFoundError(remote_path)
+
+		remote_parent, remote_name = os.path.split(os.path.normpath(remote_path))
+		stdout = self.execute(f'tar -cf - -C {shlex.quote(remote_parent or ".")} {shlex.quote(remote_name)}')
+
+		try:
+			with tarfile.open(fileobj = stdout, mode = 'r|') as tar:
+				for member in tar:
+					# Members are extracted right into the local folder, so we remove the remote folder's name from their paths
+					# We only accept regular files and folders, inside the archived folder
+
+					parts = pathlib.PurePosixPath(member.name).parts
+
+					if not(parts) or parts[0] != remote_name or '..' in parts or not(member.isfile() or member.isdir()):
+						raise RemoteArchiveError(remote_path)
+
+					member.name = os.path.join(*parts[1:]) if len(parts) > 1 else '.'
+					tar.extract(member, local_path, **TAR_EXTRACT_KWARGS)
+
+			if stdout.channel.recv_exit_status() != 0:
+				raise RemoteArchiveError(remote_path)
+
+		except (tarfile.TarError, RemoteArchiveError):
+			# Close the channel to not leave the remote command running
+			stdout.channel.close()
+			raise RemoteArchiveError(remote_path)
+
+		# The whole folder is deleted in one command, the SFTP deletion is only used if it fails
+
+		if delete:
+			if self.execute(f'rm -rf {shlex.quote(remote_path)}').channel.recv_exit_status() != 0:
+				self.deleteRemote(remote_path)
 
 		return local_path
 
+	def receiveMultiple(self, entries, *, delete = False, max_workers = 4):
+		'''
+		Receive multiple files or folders.
+		In remote mode, the downloads are made in parallel, each one in its own SFTP session.
+		These sessions are taken from the pool, and put back in it at the end.
+
+		Parameters
+		----------
+		entries : list
+			List of `(remote_path, local_path)` tuples describing the files/folders to receive.
+
+		delete : boolean
+			`True` to delete the remote files/folders.
+
+		max_workers : int
+			Maximum number of simultaneous downloads.
+
+		Returns
+		-------
+		received : generator
+			Generator yielding, in order of completion, each entry along with a boolean: `True` if it has been received, `False` if the remote path does not exist.
+		'''
+
+		if self._local or max_workers <= 1 or len(entries) <= 1:
+			for entry in entries:
+				try:
+					self.receive(*entry, delete = delete)
+
+				except RemotePathNotFoundError:
+					yield entry, False
+
+				else:
+					yield entry, True
+
+			return
+
+		# One SFTP session per worker: a session cannot be used by multiple threads at the same time
+
+		sessions = [self._acquireSFTP() for k in range(min(max_workers, len(entries)))]
+		available_sessions = queue.SimpleQueue()
+
+		for sftp in sessions:
+			available_sessions.put(sftp)
+
+		def receiveEntry(entry):
+			sftp = available_sessions.get()
+
+			try:
+				self._receiveWith(sftp, *entry, delete = delete)
+
+			except RemotePathNotFoundError:
+				return entry, False
+
+			else:
+				return entry, True
+
+			finally:
+				available_sessions.put(sftp)
+
+		try:
+			with concurrent.futures.ThreadPoolExecutor(max_workers = len(sessions)) as executor:
+				for future in concurrent.futures.as_completed([executor.submit(receiveEntry, entry) for entry in entries]):
+					yield future.result()
+
+		finally:
+			for sftp in sessions:
+				self._releaseSFTP(sftp)
+
 	def deleteRemote(self, entries):
 		'''
 		Recursively delete some remote entries.
@@ -20,6 +20,9 @@ class SimulationBaseSetting(abc.ABC):
 		Default value of the setting.
 	'''
 
+	# Attributes to share with the copies instead of copying them
+	_shared_attributes = ['_simulation']
+
 	def __init__(self, simulation, setting_name, setting_value):
 		self._simulation = simulation
 
@@ -28,7 +31,7 @@ class SimulationBaseSetting(abc.ABC):
 
 	def __deepcopy__(self, memo):
 		'''
-		Override the default behavior of `deepcopy()` to keep the references to the Simulation.
+		Override the default behavior of `deepcopy()` to keep the references to the Simulation, and to the other shared attributes.
 		'''
 
 		cls = self.__class__
@@ -36,7 +39,7 @@ class SimulationBaseSetting(abc.ABC):
 		memo[id(self)] = result
 
 		for k, v in self.__dict__.items():
-			if k == '_simulation':
+			if k in self._shared_attributes:
 				setattr(result, k, v)
 
 			else:
@@ -88,3 +91,4 @@ class SimulationBaseSetting(abc.ABC):
 		'''
 
 		self._value = new_value
+		self._simulation.clearCache()
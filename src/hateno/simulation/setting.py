@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import re
+import string
 
 from .errors import *
 from .basesetting import SimulationBaseSetting
@@ -30,32 +31,27 @@ class SimulationSetting(SimulationBaseSetting):
 		The setting has not been found in the set.
 	'''
 
+	# The descriptions of the setting and its set come from the folder's settings, they are never modified
+	_shared_attributes = SimulationBaseSetting._shared_attributes + ['_settings_set_dict', '_setting_dict']
+
 	def __init__(self, simulation, set_name, setting_name):
 		try:
-			self._settings_set_dict = [
-				settings_set
-				for settings_set in simulation.folder.settings['settings']
-				if settings_set['set'] == set_name
-			][0]
+			self._settings_set_dict, settings_dicts = simulation.folder.settings_sets[set_name]
 
-		except IndexError:
+		except KeyError:
 			raise SettingsSetNotFoundError(set_name)
 
 		try:
-			self._setting_dict = [
-				setting
-				for setting in self._settings_set_dict['settings']
-				if setting['name'] == setting_name
-			][0]
+			self._setting_dict = settings_dicts[setting_name]
 
-		except IndexError:
+		except KeyError:
 			raise SettingNotFoundError(set_name, setting_name)
 
 		super().__init__(simulation, setting_name, self._setting_dict['default'])
 
 		self._set_name = set_name
-		self._exclude_for_db = 'exclude' in self._setting_dict and self._setting_dict['exclude']
-		self._pattern = self._setting_dict['pattern'] if 'pattern' in self._setting_dict else self._simulation.folder.settings['setting_pattern']
+		self._exclude_for_db = self._setting_dict.get('exclude', False)
+		self._pattern = self._setting_dict.get('pattern', self._simulation.folder.settings['setting_pattern'])
 
 		self._use_only_if = 'only_if' in self._setting_dict
 		if self._use_only_if:
@@ -63,6 +59,7 @@ class SimulationSetting(SimulationBaseSetting):
 
 		self._fixers_dict = None
 		self._namers_dict = None
+		self._pattern_fields = None
 
 	def __str__(self):
 		'''
@@ -74,15 +71,28 @@ class SimulationSetting(SimulationBaseSetting):
 			The representation of the setting.
 		'''
 
-		value = self.value
+		# Only compute the name and the value if the pattern uses them, as namers can be costly
+
+		if self._pattern_fields is None:
+			self._pattern_fields = set(re.match(r'[^.\[]*', field).group(0) for _, field, _, _ in string.Formatter().parse(self._pattern) if field is not None)
+
+		format_kwargs = {}
+
+		if self._pattern_fields:
+			value = self.value
 
-		if type(value) is str and (not(value) or re.search(r'\s', value) is not None):
-			value = repr(value)
+			if self._pattern_fields - {'value'}:
+				format_kwargs['name'] = self._getDisplayName(value)
 
-		elif type(value) is list:
-			value = ' '.join(map(str, value))
+			if type(value) is str and (not(value) or re.search(r'\s', value) is not None):
+				value = repr(value)
 
-		return self._pattern.format(name = self.display_name, value = value)
+			elif type(value) is list:
+				value = ' '.join(map(str, value))
+
+			format_kwargs['value'] = value
+
+		return self._pattern.format(**format_kwargs)
 
 	def as_dict(self):
 		'''
@@ -94,9 +104,26 @@ class SimulationSetting(SimulationBaseSetting):
 			A dictionary listing some properties of the setting.
 		'''
 
+		return self._getDict(self.value)
+
+	def _getDict(self, value):
+		'''
+		Dictionary representation of the setting, with an already computed value.
+
+		Parameters
+		----------
+		value : mixed
+			Value of the setting.
+
+		Returns
+		-------
+		setting : dict
+			A dictionary listing some properties of the setting.
+		'''
+
 		return {
 			'name': self.name,
-			'value': self.value,
+			'value': value,
 			'local_index': self._local_index,
 			'local_total': self._simulation.getSettingCount(self.name, self._set_name),
 			'global_index': self._global_index,
@@ -204,7 +231,24 @@ class SimulationSetting(SimulationBaseSetting):
 			Name to use.
 		'''
 
-		return self._simulation.folder.applyNamers(self.as_dict(), **self._namers)
+		return self._getDisplayName(self.value)
+
+	def _getDisplayName(self, value):
+		'''
+		Get the name of the setting to use inside the simulation, with an already computed value.
+
+		Parameters
+		----------
+		value : mixed
+			Value of the setting.
+
+		Returns
+		-------
+		name : str
+			Name to use.
+		'''
+
+		return self._simulation.folder.applyNamers(self._getDict(value), **self._namers)
 
 	@property
 	def exclude(self):
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import copy
+import itertools
 import re
 import os
 
@@ -10,6 +11,31 @@ from .setting import SimulationSetting
 from .errors import *
 from ..utils import string, jsonfiles
 
+# Regex to detect whether there is a setting or global setting tag in a string
+SETTING_TAG_REGEX = re.compile(r'\{(?P<category>(?:global)?setting):(?:(?P<setname>.+?)(?:\[(?P<index>[0-9]+)\])?\.)?(?P<name>.+?)\}')
+
+# Regex to detect whether we need to evaluate a part of a string
+# The `\)*` part is needed so we don't have troubles with functions calls right before the end of a string.
+# Without this, such calls (e.g. in "((sqrt(16)))") end the string prematurely.
+EVAL_TAG_REGEX = re.compile(r'\(\((.*?\)*)\)\)')
+
+def _copyValue(value):
+	'''
+	Copy a setting value if it is mutable, so the cached values cannot be modified from outside.
+
+	Parameters
+	----------
+	value : mixed
+		The value to copy.
+
+	Returns
+	-------
+	value : mixed
+		The copy, or the value itself if it is immutable.
+	'''
+
+	return copy.deepcopy(value) if type(value) in [list, dict] else value
+
 class Simulation():
 	'''
 	Represent a simulation, itself identified by its settings.
@@ -32,9 +58,10 @@ class Simulation():
 
 		self._indexed_settings = None
 
-		self._setting_tag_regex_compiled = None
-		self._eval_tag_regex_compiled = None
-		self._parser_recursion_stack = []
+		self._settings_dict = None
+		self._settings_as_strings_dict = None
+		self._globalsettings_dict = None
+		self._command_line_str = None
 
 	@classmethod
 	def ensureType(cls, simulation, folder):
@@ -81,6 +108,17 @@ class Simulation():
 			}
 		})
 
+	def clearCache(self):
+		'''
+		Forget the computed settings, so they are generated again at the next access.
+		Must be called each time the value of a setting changes.
+		'''
+
+		self._settings_dict = None
+		self._settings_as_strings_dict = None
+		self._globalsettings_dict = None
+		self._command_line_str = None
+
 	@property
 	def folder(self):
 		'''
@@ -115,7 +153,7 @@ class Simulation():
 		'''
 
 		try:
-			return self.globalsettings[key]
+			return _copyValue(self._globalsettings_values[key])
 
 		except KeyError:
 			raise KeyError('The key does not exist in the global settings')
@@ -139,9 +177,9 @@ class Simulation():
 		'''
 
 		try:
-			setting = [setting for setting in self._globalsettings if setting.name == key][0]
+			setting = self._globalsettings[key]
 
-		except IndexError:
+		except KeyError:
 			raise KeyError('The key does not exist in the global settings')
 
 		else:
@@ -165,11 +203,11 @@ class Simulation():
 	@property
 	def _globalsettings(self):
 		'''
-		Return (and generate if needed) the complete list of global settings.
+		Return (and generate if needed) the complete list of global settings, indexed by their names.
 
 		Returns
 		-------
-		raw_globalsettings : list
+		raw_globalsettings : dict
 			The global settings.
 		'''
 
@@ -251,12 +289,21 @@ class Simulation():
 			List of sets of settings.
 		'''
 
+		if self._settings_dict is None:
+			self._settings_dict = {
+				settings_set_name: [
+					{s.name: s.value for s in settings_set if not(s.exclude)}
+					for settings_set in settings_sets
+				]
+				for settings_set_name, settings_sets in self._settings.items()
+			}
+
 		return {
 			settings_set_name: [
-				{s.name: s.value for s in settings_set if not(s.exclude)}
+				{name: _copyValue(value) for name, value in settings_set.items()}
 				for settings_set in settings_sets
 			]
-			for settings_set_name, settings_sets in self._settings.items()
+			for settings_set_name, settings_sets in self._settings_dict.items()
 		}
 
 	@property
@@ -291,12 +338,18 @@ class Simulation():
 			Settings, generated according to their pattern and organized by sets.
 		'''
 
+		if self._settings_as_strings_dict is None:
+			self._settings_as_strings_dict = {
+				set_name: [
+					[str(s) for s in settings_set if s.shouldBeDisplayed()]
+					for settings_set in settings_sets
+				]
+				for set_name, settings_sets in self._settings.items()
+			}
+
 		return {
-			set_name: [
-				[str(s) for s in settings_set if s.shouldBeDisplayed()]
-				for settings_set in settings_sets
-			]
-			for set_name, settings_sets in self._settings.items()
+			set_name: [list(settings_set) for settings_set in settings_sets]
+			for set_name, settings_sets in self._settings_as_strings_dict.items()
 		}
 
 	@property
@@ -310,62 +363,49 @@ class Simulation():
 			The global settings.
 		'''
 
-		return {setting.name: setting.value for setting in self._globalsettings}
+		return {name: _copyValue(value) for name, value in self._globalsettings_values.items()}
 
 	@property
-	def command_line(self):
+	def _globalsettings_values(self):
 		'''
-		Return the command line to use to generate this simulation.
+		Return the cached values of the global settings.
+		This dictionary must not be modified: use `globalsettings` to get a copy.
 
 		Returns
 		-------
-		command_line : str
-			The command line to execute.
-		'''
-
-		return ' '.join([self._folder.settings['exec']] + sum(sum(self.settings_as_strings.values(), []), []))
-
-	@property
-	def _setting_tag_regex(self):
-		'''
-		Regex to detect whether there is a setting or global setting tag in a string.
-
-		Returns
-		-------
-		regex : re.Pattern
-			The setting tag regex.
+		settings : dict
+			The global settings.
 		'''
 
-		if self._setting_tag_regex_compiled is None:
-			self._setting_tag_regex_compiled = re.compile(r'\{(?P<category>(?:global)?setting):(?:(?P<setname>.+?)(?:\[(?P<index>[0-9]+)\])?\.)?(?P<name>.+?)\}')
+		if self._globalsettings_dict is None:
+			self._globalsettings_dict = {name: setting.value for name, setting in self._globalsettings.items()}
 
-		return self._setting_tag_regex_compiled
+		return self._globalsettings_dict
 
 	@property
-	def _eval_tag_regex(self):
+	def command_line(self):
 		'''
-		Regex to detect whether we need to evaluate a part of a string.
+		Return the command line to use to generate this simulation.
 
 		Returns
 		-------
-		regex : re.Pattern
-			The eval tag regex.
+		command_line : str
+			The command line to execute.
 		'''
 
-		# The `\)*` part is needed so we don't have troubles with functions calls right before the end of a string.
-		# Without this, such calls (e.g. in "((sqrt(16)))") end the string prematurely.
-
-		if self._eval_tag_regex_compiled is None:
-			self._eval_tag_regex_compiled = re.compile(r'\(\((.*?\)*)\)\)')
+		if self._command_line_str is None:
+			settings_sets = itertools.chain.from_iterable(self.settings_as_strings.values())
+			self._command_line_str = ' '.join(itertools.chain([self._folder.settings['exec']], itertools.chain.from_iterable(settings_sets)))
 
-		return self._eval_tag_regex_compiled
+		return self._command_line_str
 
 	def generateGlobalSettings(self):
 		'''
 		Generate the full list of global settings.
 		'''
 
-		self._raw_globalsettings = []
+		self._raw_globalsettings = {}
+		self.clearCache()
 
 		for setting in self._folder.settings['globalsettings']:
 			try:
@@ -374,7 +414,7 @@ class Simulation():
 			except KeyError:
 				setting_value = setting['default']
 
-			self._raw_globalsettings.append(SimulationGlobalSetting(self, setting['name'], setting_value))
+			self._raw_globalsettings[setting['name']] = SimulationGlobalSetting(self, setting['name'], setting_value)
 
 	def getSettingCount(self, setting_name, set_name = None):
 		'''
@@ -485,18 +525,17 @@ class Simulation():
 		'''
 
 		if type(self._user_settings['settings']) is list:
-			user_settings = {
-				setting_set_name: [s['settings'] for s in self._user_settings['settings'] if s['set'] == setting_set_name]
-				for setting_set_name in set([s['set'] for s in self._user_settings['settings']])
-			}
+			user_settings = {}
+
+			for s in self._user_settings['settings']:
+				user_settings.setdefault(s['set'], []).append(s['settings'])
 
 		else:
 			user_settings = self._user_settings['settings']
 
-		default_pattern = self._folder.settings['setting_pattern']
-
 		self._raw_settings = {}
 		self._indexed_settings = {'global': {}, 'local': {}}
+		self.clearCache()
 
 		for settings_set in self._folder.settings['settings']:
 			default_settings = [
@@ -538,18 +577,16 @@ class Simulation():
 			The value of the setting.
 		'''
 
+		category, setname, index, name = match.group('category', 'setname', 'index', 'name')
+
 		try:
-			if match.group('category') == 'globalsetting':
-				return [
-					setting.value
-					for setting in self._globalsettings
-					if setting.name == match.group('name')
-				][0]
+			if category == 'globalsetting':
+				return self._globalsettings[name].value
 
-			set_dict = self._indexed_settings['global'] if match.group('setname') is None else self._indexed_settings['local'][match.group('setname')]
-			set_list = set_dict[match.group('name')]
+			set_dict = self._indexed_settings['global'] if setname is None else self._indexed_settings['local'][setname]
+			set_list = set_dict[name]
 
-			k = 0 if match.group('index') is None else int(match.group('index'))
+			k = 0 if index is None else int(index)
 
 			return set_list[k].value
 
@@ -603,48 +640,64 @@ class Simulation():
 		if not(type(s) is str):
 			return s
 
-		try:
-			return float(s)
+		# We search for settings tags in the string, and replace them until the string does not change anymore
+		# The already seen strings are stored to stop if the tags are defined in a circular way
 
-		except ValueError:
-			pass
+		parsed_strings = set()
 
-		s = s.strip()
+		while True:
+			try:
+				return float(s)
 
-		# We search for settings tags in the string, and recursively replace them
+			except ValueError:
+				pass
 
-		if self._raw_settings is None:
-			self.generateSettings()
+			s = s.strip()
 
-		fullmatch = self._setting_tag_regex.fullmatch(s)
+			# No need to use the regex if there is obviously no tag
 
-		if fullmatch:
-			try:
-				return copy.deepcopy(self.getSettingValueFromTag(fullmatch))
+			if not('{' in s):
+				parsed = s
+				break
 
-			except KeyError:
-				return s
+			if self._raw_settings is None:
+				self.generateSettings()
+
+			fullmatch = SETTING_TAG_REGEX.fullmatch(s)
+
+			if fullmatch:
+				try:
+					value = self.getSettingValueFromTag(fullmatch)
+
+				except KeyError:
+					return s
 
-		parsed = self._setting_tag_regex.sub(self.replaceSettingTag, s)
+				# Only mutable values need to be copied
+				return _copyValue(value)
 
-		self._parser_recursion_stack.append(s)
+			parsed = SETTING_TAG_REGEX.sub(self.replaceSettingTag, s)
 
-		if not(parsed in self._parser_recursion_stack):
-			return self.parseString(parsed)
+			parsed_strings.add(s)
 
-		self._parser_recursion_stack.clear()
+			if parsed in parsed_strings:
+				break
+
+			s = parsed
 
 		# Final step: we try to evaluate the needed parts of the string to apply allowed operations, if any.
 		# ValueError is raised if the string contains any unallowed operation, like the use of exec() or other evil functions.
 
+		if not('((' in parsed):
+			return parsed
+
 		try:
-			fullmatch = self._eval_tag_regex.fullmatch(parsed)
+			fullmatch = EVAL_TAG_REGEX.fullmatch(parsed)
 
 			if fullmatch:
 				parsed = string.safeEval(fullmatch.group(1))
 
 			else:
-				parsed = self._eval_tag_regex.sub(lambda m: str(string.safeEval(m.group(1))), parsed)
+				parsed = EVAL_TAG_REGEX.sub(lambda m: str(string.safeEval(m.group(1))), parsed)
 
 		except (SyntaxError, ValueError):
 			pass
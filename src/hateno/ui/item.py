@@ -14,6 +14,8 @@ class UIDisplayedItem(abc.ABC):
 		The UI object this item belongs to.
 	'''
 
+	__slots__ = ('ui', 'position')
+
 	def __init__(self, ui):
 		self.ui = ui
 		self.position = self.ui._cursor_vertical_pos
@@ -52,11 +54,12 @@ class UIDisplayedItem(abc.ABC):
 
 		@functools.wraps(func)
 		def wrapper(self, *args, **kwargs):
-			self.ui.moveCursorTo(self.position)
+			with self.ui._frame():
+				self.ui.moveCursorTo(self.position)
 
-			func(self, *args, **kwargs)
+				func(self, *args, **kwargs)
 
-			self.ui.moveToLastLine()
+				self.ui.moveToLastLine()
 
 		return wrapper
 
@@ -73,6 +76,7 @@ class UIDisplayedItem(abc.ABC):
 		Display enough spaces to clear the object.
 		'''
 
-		self.ui.moveCursorTo(self.position)
-		print(' ' * self.width, end = '\r')
-		self.ui.moveToLastLine()
+		with self.ui._frame():
+			self.ui.moveCursorTo(self.position)
+			self.ui._write(' ' * self.width + '\r')
+			self.ui.moveToLastLine()
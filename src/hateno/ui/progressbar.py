@@ -2,9 +2,13 @@
 # -*- coding: utf-8 -*-
 
 from math import floor, log10
+import time
 
 from .item import UIDisplayedItem
 
+# Minimum delay between two renders caused by counter updates, in seconds
+RENDER_MIN_DELAY = 1 / 30
+
 class UIProgressBar(UIDisplayedItem):
 	'''
 	Represent a progress bar displayed in the UI.
@@ -31,12 +35,22 @@ class UIProgressBar(UIDisplayedItem):
 		Special value `'auto'` to guess the needed precision from the total.
 	'''
 
+	__slots__ = (
+		'_total', '_counter', '_last_render_time', '_dirty',
+		'_bar_length', '_empty_char', '_full_char', '_percentage_precision',
+		'_counter_spec', '_total_str', '_bar_spec', '_percentage_spec', '_bars',
+		'_width', '_blank'
+	)
+
 	def __init__(self, ui, total, *, bar_length = 40, empty_char = '░', full_char = '█', percentage_precision = 'auto'):
 		super().__init__(ui)
 
 		self._total = total
 		self._counter = 0
 
+		self._last_render_time = 0
+		self._dirty = False
+
 		self._bar_length = bar_length
 		self._empty_char = empty_char
 		self._full_char = full_char
@@ -47,11 +61,18 @@ class UIProgressBar(UIDisplayedItem):
 		else:
 			self._percentage_precision = percentage_precision
 
-		self._pattern = ' '.join([
-			f'{{counter:>{len(str(self._total))}d}}/{self._total}',
-			f'{{bar:{self._empty_char}<{self._bar_length}}}',
-			f'{{percentage:>{5 + self._percentage_precision}.{self._percentage_precision}%}}'
-		])
+		# The format specifications are prepared once, and there are only `bar_length + 1` possible bars, so they are all built here
+
+		self._counter_spec = f'>{len(str(self._total))}d'
+		self._total_str = f'/{self._total} '
+		self._bar_spec = f'{self._empty_char}<{self._bar_length}'
+		self._percentage_spec = f'>{5 + self._percentage_precision}.{self._percentage_precision}%'
+
+		self._bars = [format(self._full_char * n_full_chars, self._bar_spec) for n_full_chars in range(self._bar_length + 1)]
+
+		# The width does not depend on the counter, so it is computed once, as well as the string to clear the bar
+		self._width = len(self._format(0, 0, 0))
+		self._blank = ' ' * self._width
 
 	@property
 	def height(self):
@@ -77,7 +98,7 @@ class UIProgressBar(UIDisplayedItem):
 			The complete width (counter + bar + percentage lengths).
 		'''
 
-		return len(self._pattern.format(counter = 0, bar = '', percentage = 0))
+		return self._width
 
 	@property
 	def counter(self):
@@ -92,6 +113,35 @@ class UIProgressBar(UIDisplayedItem):
 
 		return self._counter
 
+	def _format(self, counter, n_full_chars, percentage):
+		'''
+		Build the string representing the progress bar.
+
+		Parameters
+		----------
+		counter : int
+			Value of the counter.
+
+		n_full_chars : int
+			Number of characters to fill in the bar.
+
+		percentage : float
+			Percentage to display.
+
+		Returns
+		-------
+		progress_bar : str
+			The progress bar.
+		'''
+
+		if 0 <= n_full_chars <= self._bar_length:
+			bar = self._bars[n_full_chars]
+
+		else:
+			bar = format(self._full_char * n_full_chars, self._bar_spec)
+
+		return ''.join([format(counter, self._counter_spec), self._total_str, bar, ' ', format(percentage, self._percentage_spec)])
+
 	@UIDisplayedItem.renderer
 	def render(self):
 		'''
@@ -101,17 +151,45 @@ class UIProgressBar(UIDisplayedItem):
 		percentage = self._counter / self._total
 		n_full_chars = round(percentage * self._bar_length)
 
-		print(self._pattern.format(counter = self._counter, bar = self._full_char * n_full_chars, percentage = percentage), end = '\r')
+		self.ui._write(self._format(self._counter, n_full_chars, percentage) + '\r')
+
+		self._last_render_time = time.monotonic()
+		self._dirty = False
+
+	@UIDisplayedItem.renderer
+	def clear(self):
+		'''
+		Display enough spaces to clear the progress bar.
+		'''
+
+		self.ui._write(self._blank + '\r')
 
 	@counter.setter
 	def counter(self, n):
 		'''
 		Set the value of the counter.
+		The bar always has the same width, so the new render overwrites the previous one without needing to clear it.
+		To limit the output when the counter is updated at a high rate, the bar is not rendered if the previous render is too recent, except when reaching the total.
 		'''
 
-		self.clear()
+		if n == self._counter:
+			return
+
 		self._counter = n
-		self.render()
+
+		if n == self._total or time.monotonic() - self._last_render_time >= RENDER_MIN_DELAY:
+			self.render()
+
+		else:
+			self._dirty = True
+
+	def flush(self):
+		'''
+		Render the progress bar if its last counter update has not been displayed yet.
+		'''
+
+		if self._dirty:
+			self.render()
 
 	def update(self, delta = 1):
 		'''
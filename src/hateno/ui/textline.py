@@ -16,10 +16,13 @@ class UITextLine(UIDisplayedItem):
 		The text to display.
 	'''
 
+	__slots__ = ('_text', '_width')
+
 	def __init__(self, ui, text):
 		super().__init__(ui)
 
 		self._text = text
+		self._width = len(text)
 
 	@property
 	def height(self):
@@ -46,7 +49,7 @@ class UITextLine(UIDisplayedItem):
 			The length of the text.
 		'''
 
-		return len(self.text)
+		return self._width
 
 	@property
 	def text(self):
@@ -67,7 +70,7 @@ class UITextLine(UIDisplayedItem):
 		Print the text.
 		'''
 
-		print(self._text, end = '\r')
+		self.ui._write(self._text + '\r')
 
 	@text.setter
 	def text(self, new_text):
@@ -80,6 +83,8 @@ class UITextLine(UIDisplayedItem):
 			New text to display.
 		'''
 
-		self.clear()
-		self._text = new_text
-		self.render()
+		with self.ui._frame():
+			self.clear()
+			self._text = new_text
+			self._width = len(new_text)
+			self.render()
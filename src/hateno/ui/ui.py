@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import contextlib
+import sys
+
 from .textline import UITextLine
 from .progressbar import UIProgressBar
 from .errors import *
@@ -30,11 +33,51 @@ class UI():
 
 		self._items = []
 
+		# The output is buffered during a frame, and written all at once at the end of the outermost one
+		self._output_buffer = []
+		self._frames_depth = 0
+
 		self._progress_bars_length = progress_bars_length
 		self._progress_bars_empty_char = progress_bars_empty_char
 		self._progress_bars_full_char = progress_bars_full_char
 		self._progress_bars_percentage_precision = progress_bars_percentage_precision
 
+	@contextlib.contextmanager
+	def _frame(self):
+		'''
+		Context manager to buffer the output, and write it when leaving the outermost frame.
+		'''
+
+		self._frames_depth += 1
+
+		try:
+			yield
+
+		finally:
+			self._frames_depth -= 1
+
+			if self._frames_depth == 0 and self._output_buffer:
+				sys.stdout.write(''.join(self._output_buffer))
+				sys.stdout.flush()
+				self._output_buffer.clear()
+
+	def _write(self, s):
+		'''
+		Write a string, or add it to the buffer if we are in a frame.
+
+		Parameters
+		----------
+		s : str
+			The string to write.
+		'''
+
+		if self._frames_depth:
+			self._output_buffer.append(s)
+
+		else:
+			sys.stdout.write(s)
+			sys.stdout.flush()
+
 	@property
 	def _last_line(self):
 		'''
@@ -66,7 +109,7 @@ class UI():
 
 		if cursor_offset != 0:
 			cursor_direction = 'A' if cursor_offset < 0 else 'B'
-			print(f'\u001b[{abs(cursor_offset)}{cursor_direction}', end = '\r')
+			self._write(f'\u001b[{abs(cursor_offset)}{cursor_direction}\r')
 
 			self._cursor_vertical_pos = pos
 
@@ -80,7 +123,7 @@ class UI():
 
 		if last_line > self._max_line:
 			self.moveCursorTo(last_line - 1)
-			print('')
+			self._write('\n')
 			self._cursor_vertical_pos += 1
 			self._max_line = last_line
 
@@ -107,16 +150,17 @@ class UI():
 			The newly added item.
 		'''
 
-		if position >= 0:
-			self.moveDownFrom(position)
-			self.moveCursorTo(position)
+		with self._frame():
+			if position >= 0:
+				self.moveDownFrom(position)
+				self.moveCursorTo(position)
 
-		else:
-			self.moveToLastLine()
+			else:
+				self.moveToLastLine()
 
-		item = item_type(self, **args)
-		self._items.append(item)
-		item.render()
+			item = item_type(self, **args)
+			self._items.append(item)
+			item.render()
 
 		return item
 
@@ -198,10 +242,11 @@ class UI():
 		if item.position <= 0:
 			raise UINonMovableLine(item.position)
 
-		item.clear()
-		self.moveCursorTo(item.position - 1)
-		item.position -= 1
-		item.render()
+		with self._frame():
+			item.clear()
+			self.moveCursorTo(item.position - 1)
+			item.position -= 1
+			item.render()
 
 	def moveUpFrom(self, pos):
 		'''
@@ -224,8 +269,9 @@ class UI():
 		items_to_move = [item for item in self._items if item.position >= pos]
 		items_to_move.sort(key = lambda item: item.position)
 
-		for item in items_to_move:
-			self.moveUp(item)
+		with self._frame():
+			for item in items_to_move:
+				self.moveUp(item)
 
 	def moveDown(self, item):
 		'''
@@ -242,10 +288,11 @@ class UI():
 			The line can't be moved.
 		'''
 
-		item.clear()
-		self.moveCursorTo(item.position + 1)
-		item.position += 1
-		item.render()
+		with self._frame():
+			item.clear()
+			self.moveCursorTo(item.position + 1)
+			item.position += 1
+			item.render()
 
 	def moveDownFrom(self, pos):
 		'''
@@ -265,8 +312,9 @@ class UI():
 		items_to_move = [item for item in self._items if item.position >= pos]
 		items_to_move.sort(key = lambda item: item.position, reverse = True)
 
-		for item in items_to_move:
-			self.moveDown(item)
+		with self._frame():
+			for item in items_to_move:
+				self.moveDown(item)
 
 	def removeItem(self, item):
 		'''
@@ -278,7 +326,8 @@ class UI():
 			The item to remove.
 		'''
 
-		item.clear()
-		self.moveUpFrom(item.position + 1)
-		self._items.remove(item)
-		self.moveToLastLine()
+		with self._frame():
+			item.clear()
+			self.moveUpFrom(item.position + 1)
+			self._items.remove(item)
+			self.moveToLastLine()
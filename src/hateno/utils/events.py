@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from .fcollection import FCollection
 from .errors import *
 
 class Events():
@@ -15,7 +14,8 @@ class Events():
 	'''
 
 	def __init__(self, events_names):
-		self._callbacks = FCollection(categories = events_names)
+		# Callbacks of each event, indexed by their names
+		self._callbacks = {event: {} for event in events_names}
 
 	def addListener(self, event, f):
 		'''
@@ -36,16 +36,17 @@ class Events():
 		'''
 
 		try:
-			fname = f.__name__
-			if fname == '<lambda>':
-				n = len(self._callbacks.getAll(category = event))
-				fname = f'lambda{n}'
+			callbacks = self._callbacks[event]
 
-			self._callbacks.set(fname, f, category = event)
-
-		except FCollectionCategoryNotFoundError:
+		except KeyError:
 			raise EventUnknownError(event)
 
+		fname = f.__name__
+		if fname == '<lambda>':
+			fname = f'lambda{len(callbacks)}'
+
+		callbacks[fname] = f
+
 	def trigger(self, event, *args):
 		'''
 		Call all functions attached to a given event.
@@ -65,11 +66,11 @@ class Events():
 		'''
 
 		try:
-			functions = self._callbacks.getAll(category = event)
+			callbacks = self._callbacks[event]
 
-		except FCollectionCategoryNotFoundError:
+		except KeyError:
 			raise EventUnknownError(event)
 
-		else:
-			for f in functions:
-				f(*args)
+		# A copy is needed as a callback could add a new listener to the same event
+		for f in tuple(callbacks.values()):
+			f(*args)
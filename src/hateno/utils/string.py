@@ -3,7 +3,6 @@
 
 import ast
 import base64
-import codecs
 import hashlib
 from math import sqrt, cos, sin, tan, pi
 import json
@@ -82,10 +81,8 @@ def hash(s):
 		The hash.
 	'''
 
-	h = hashlib.md5(s.encode('utf-8')).hexdigest()
-	b = codecs.encode(codecs.decode(h.encode('utf-8'), 'hex'), 'base64').decode()
-
-	return b[:-1].replace('+', '-').replace('/', '_')[:-2]
+	# The 16 bytes of the digest give 22 significant base64 characters, followed by the `==` padding
+	return base64.urlsafe_b64encode(hashlib.md5(s.encode('utf-8')).digest()).decode('ascii')[:22]
 
 def uniqueID():
 	'''